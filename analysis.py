@@ -0,0 +1,357 @@
+import argparse
+import math
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from main import Board
+from memory import AllocationCounter, BoundedTable, estimate_entry_bytes, move_buffer, per_node, track_memory
+from player import score_position
+from profiles import analyze_kwargs, select_profile
+
+PLAYER1_PIECE = 1
+PLAYER2_PIECE = 2
+
+# Transposition table bound flags
+EXACT = 0
+LOWER = 1
+UPPER = 2
+
+
+class _Timeout(Exception):
+    """
+    Raised inside a search once the time limit has passed
+    """
+
+
+def board_from_position(position, m=7, n=6, k=4):
+    """
+    Builds a board from an encoded position
+
+    :param position: Board, NumPy array of shape (n, m), or string of 1-based columns played
+        alternately starting with player 1, e.g. "4453"
+    :param m: int, number of columns
+    :param n: int, number of rows
+    :param k: int, number of pieces in a row to win
+
+    :return: Board
+    """
+
+    if isinstance(position, Board):
+        return position.copy()
+
+    if isinstance(position, str):
+        board = Board(m, n, k)
+        piece = PLAYER1_PIECE
+        for char in position:
+            col = int(char) - 1
+            if not board.is_valid(col):
+                raise ValueError(f"Invalid move {char!r} in position {position!r}")
+            board.add_piece(col, piece)
+            piece = PLAYER2_PIECE if piece == PLAYER1_PIECE else PLAYER1_PIECE
+        return board
+
+    grid = np.asarray(position, dtype=np.int8)
+    rows, cols = grid.shape
+    board = Board(cols, rows, k)
+    board.board = grid.copy()
+    return board
+
+
+def analyze(
+        positions,
+        depth=None,
+        time_limit=None,
+        use_heuristic=True,
+        m=7,
+        n=6,
+        k=4,
+        workers=1,
+        table=None,
+        memory_budget=None,
+        track_memory=False,
+):
+    """
+    Finds the best move for each position of a batch
+
+    Positions are scored from player 1's point of view. Player 1 is to move when both
+    players have the same number of pieces on the board.
+
+    :param positions: list of positions, see board_from_position
+    :param depth: int, depth of the search tree, ignored without heuristic
+    :param time_limit: float, seconds per position for iterative deepening, used when depth is None
+    :param use_heuristic: bool, True if heuristic evaluation function is used, False solves each position
+    :param m: int, number of columns for positions given as strings
+    :param n: int, number of rows for positions given as strings
+    :param k: int, number of pieces in a row to win
+    :param workers: int, number of worker processes the batch is split across
+    :param table: dict, transposition table shared across the batch, a new one is used if None,
+        only supported when workers is 1
+    :param memory_budget: int, bytes available to the transposition table of each process, unbounded if None
+    :param track_memory: bool, True if each search is traced with tracemalloc and reported under "memory"
+
+    :return: list of dicts with the move, score, pv, depth, nodes and time of each position
+    """
+
+    if use_heuristic and depth is None and time_limit is None:
+        raise ValueError("Either depth or time_limit is required when using the heuristic")
+
+    if table is not None and workers > 1:
+        raise ValueError("A table can only be shared when workers is 1")
+
+    positions = list(positions)
+    settings = (depth, time_limit, use_heuristic, m, n, k, memory_budget, track_memory)
+
+    if workers <= 1 or len(positions) <= 1:
+        return _analyze_chunk(positions, settings, table)
+
+    # Each worker keeps its own table for its contiguous share of the batch
+    chunk_size = math.ceil(len(positions) / workers)
+    chunks = [positions[i:i + chunk_size] for i in range(0, len(positions), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_analyze_chunk, chunks, [settings] * len(chunks))
+    return [result for chunk_results in results for result in chunk_results]
+
+
+def _analyze_chunk(positions, settings, table=None):
+    """
+    Analyzes a list of positions with a single transposition table
+    """
+
+    depth, time_limit, use_heuristic, m, n, k, memory_budget, tracked = settings
+    if table is None and memory_budget is not None:
+        table = BoundedTable(memory_budget, estimate_entry_bytes(m * n, key_fields=4))
+    elif table is None:
+        table = {}
+
+    # Per-ply move buffers reused by every search of the chunk
+    buffers = []
+    results = []
+    for position in positions:
+        board = board_from_position(position, m, n, k)
+        if tracked:
+            allocations = AllocationCounter()
+            result, report = track_memory(
+                _analyze_position, board, depth, time_limit, use_heuristic, table, buffers, allocations,
+                allocations=allocations,
+            )
+            result["memory"] = per_node(report, result["nodes"])
+        else:
+            result = _analyze_position(board, depth, time_limit, use_heuristic, table, buffers)
+        results.append(result)
+    return results
+
+
+def _analyze_position(board, depth, time_limit, use_heuristic, table, buffers, allocations=None):
+    """
+    Searches a single position, deepening iteratively when a time limit is given
+    """
+
+    start_time = time.time()
+    stats = {"nodes": 0, "table_hits": 0, "allocations": allocations}
+    pieces = np.count_nonzero(board.board == PLAYER1_PIECE), np.count_nonzero(board.board == PLAYER2_PIECE)
+    max_player = pieces[0] == pieces[1]
+
+    if not use_heuristic:
+        # Without heuristic the depth limit is ignored and the game is solved
+        depths = [math.inf]
+        deadline = None
+    elif depth is not None:
+        depths = [depth]
+        deadline = None
+    else:
+        depths = range(1, board.ROWS * board.COLS + 1)
+        deadline = start_time + time_limit
+
+    value, move, reached = 0, None, 0
+    for cur_depth in depths:
+        try:
+            value, move = _alphabeta(
+                board, cur_depth, -math.inf, math.inf, max_player, use_heuristic, table, stats, buffers,
+                deadline=deadline,
+            )
+        except _Timeout:
+            break
+        reached = cur_depth
+        if deadline is not None and time.time() >= deadline:
+            break
+
+    return {
+        "move": move,
+        "score": float(value),
+        "pv": _principal_variation(board, reached, max_player, table),
+        "depth": None if reached == math.inf else reached,
+        "nodes": stats["nodes"],
+        "table_hits": stats["table_hits"],
+        "time": time.time() - start_time,
+    }
+
+
+def _alphabeta(board, depth, alpha, beta, max_player, use_heuristic, table, stats, buffers, ply=0, deadline=None):
+    """
+    Minimax with alpha-beta pruning and a transposition table
+
+    Follows MiniMax.minimax with player 1 as the maximizer. Table entries hold the
+    remaining depth, the value, its bound flag and the best move. Valid moves are
+    written into the per-ply buffers instead of a new list at every node.
+
+    :return: value of the best move
+    :return: int, column of the best move
+    """
+
+    stats["nodes"] += 1
+    if stats["allocations"] is not None:
+        stats["allocations"].node()
+    if deadline is not None and stats["nodes"] % 1024 == 0 and time.time() >= deadline:
+        raise _Timeout
+
+    # Check if a terminal state has been reached
+    is_terminal, winner = board.is_terminal()
+    if is_terminal:
+        if winner == PLAYER1_PIECE:
+            return (math.inf, None)
+        elif winner == PLAYER2_PIECE:
+            return (-math.inf, None)
+        else:
+            return (0, None)
+
+    # Check if depth limit has been reached
+    if depth == 0 and use_heuristic:
+        return (score_position(board, PLAYER1_PIECE, PLAYER2_PIECE), None)
+
+    alpha_orig, beta_orig = alpha, beta
+    key = _table_key(board)
+    entry = table.get(key)
+    entry_move = None
+    if entry is not None:
+        entry_depth, entry_value, flag, entry_move = entry
+        if entry_depth >= depth:
+            if flag == EXACT:
+                stats["table_hits"] += 1
+                return entry_value, entry_move
+            elif flag == LOWER:
+                alpha = max(alpha, entry_value)
+            else:
+                beta = min(beta, entry_value)
+            if alpha >= beta:
+                stats["table_hits"] += 1
+                return entry_value, entry_move
+
+    locations = move_buffer(buffers, ply, board.COLS)
+    num_locations = board.valid_locations_into(locations)
+
+    # Search the previous best move first by swapping it to the front
+    for i in range(1, num_locations):
+        if locations[i] == entry_move:
+            locations[0], locations[i] = locations[i], locations[0]
+            break
+
+    piece = PLAYER1_PIECE if max_player else PLAYER2_PIECE
+    value = -math.inf if max_player else math.inf
+    column = locations[0]
+
+    for i in range(num_locations):
+        action = locations[i]
+        row, col = board.add_piece(action, piece)
+        try:
+            new_score, _ = _alphabeta(
+                board, depth - 1, alpha, beta, not max_player, use_heuristic, table, stats, buffers,
+                ply + 1, deadline,
+            )
+        finally:
+            # Undo the move to prevent altering the board permanently
+            board.remove_piece(row, col)
+
+        if max_player:
+            if new_score > value:
+                value = new_score
+                column = action
+            alpha = max(alpha, value)
+        else:
+            if new_score < value:
+                value = new_score
+                column = action
+            beta = min(beta, value)
+        if alpha >= beta:
+            break
+
+    if value <= alpha_orig:
+        flag = UPPER
+    elif value >= beta_orig:
+        flag = LOWER
+    else:
+        flag = EXACT
+    table[key] = (depth, value, flag, column)
+
+    return value, column
+
+
+def _table_key(board):
+    """
+    Returns the transposition table key of a board
+
+    The shape and k are part of the key so that boards of different sizes with the same
+    cell bytes never share entries.
+    """
+
+    return (board.ROWS, board.COLS, board.k, board.board.tobytes())
+
+
+def _principal_variation(board, depth, max_player, table):
+    """
+    Follows the best moves stored in the transposition table
+
+    :return: list of columns
+    """
+
+    board = board.copy()
+    pv = []
+    while len(pv) < depth:
+        entry = table.get(_table_key(board))
+        if entry is None or entry[3] is None or board.is_terminal()[0]:
+            break
+        move = entry[3]
+        board.add_piece(move, PLAYER1_PIECE if max_player else PLAYER2_PIECE)
+        pv.append(move)
+        max_player = not max_player
+    return pv
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Analyze Connect-k positions with the search profile of the board.")
+
+    parser.add_argument(
+        "positions",
+        nargs="+",
+        help="Positions as strings of 1-based columns, e.g. 4453"
+    )
+
+    parser.add_argument("--m", type=int, default=7, help="Number of columns (default: 7)")
+    parser.add_argument("--n", type=int, default=6, help="Number of rows (default: 6)")
+    parser.add_argument("--k", type=int, default=4, help="Number of pieces in a row to win (default: 4)")
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes (default: 1)"
+    )
+
+    args = parser.parse_args()
+
+    profile = select_profile(args.m, args.n, args.k)
+    results = analyze(
+        args.positions, m=args.m, n=args.n, k=args.k, workers=args.workers, **analyze_kwargs(profile),
+    )
+
+    for position, result in zip(args.positions, results):
+        move = None if result["move"] is None else result["move"] + 1
+        pv = " ".join(str(col + 1) for col in result["pv"])
+        print(f"{position or '-'}: move {move}, score {result['score']}, pv {pv}")
+
+
+if __name__ == "__main__":
+    main()
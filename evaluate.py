@@ -1,31 +1,39 @@
 import csv
-import matplotlib.pyplot as plt
 import os
 
 from main import Game
 from player import MiniMax
+from profiles import minimax_kwargs, select_profile
 
 
 PLAYER1_PIECE = 1
 PLAYER2_PIECE = 2
 
-use_pruning = True
 
-player1 = MiniMax(
-    PLAYER1_PIECE,
-    PLAYER2_PIECE,
-    max_player=True,
-    alpha_beta_pruning=use_pruning,
-    use_heuristic=False,
-)
-
-player2 = MiniMax(
-    PLAYER2_PIECE,
-    PLAYER1_PIECE,
-    max_player=False,
-    alpha_beta_pruning=use_pruning,
-    use_heuristic=False,
-)
+def plot_stats(entries, ylabel, title, filename):
+    """
+    Plots one line per (m, n, k) entry and saves the figure
+
+    matplotlib is imported here so that only the reporting path pays for it.
+    """
+
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(12, 9))
+    for params, values in entries:
+        m, n, k = params
+        label_str = f"m: {m}, n: {n}, k: {k}"
+        plt.plot(values, label=label_str)
+    plt.xlabel('Turn #')
+    plt.ylabel(ylabel)
+    plt.title(title)
+    plt.legend()
+    plt.grid()
+    plt.tight_layout()
+    plt.savefig(filename)
+
+
+use_pruning = True
 
 all_times = []
 all_move_counts = []
@@ -35,6 +43,22 @@ for m in range(3, 5):
         for k in range(3, 5):
             if k > m or k > n:
                 continue
+            profile = select_profile(m, n, k)
+            player1 = MiniMax(
+                PLAYER1_PIECE,
+                PLAYER2_PIECE,
+                max_player=True,
+                alpha_beta_pruning=use_pruning,
+                **minimax_kwargs(profile),
+            )
+            player2 = MiniMax(
+                PLAYER2_PIECE,
+                PLAYER1_PIECE,
+                max_player=False,
+                alpha_beta_pruning=use_pruning,
+                **minimax_kwargs(profile),
+            )
+
             game = Game(player1, player2, m=m, n=n, k=k)
             _, execution_times, move_counts = game.play(quiet=True, record_stats=True)
             all_times.append([(m, n, k), execution_times])
@@ -45,37 +69,16 @@ if not os.path.exists(output_folder):
     os.mkdir(output_folder)
 results = []
 
-# Plot times
-plt.figure(figsize=(12, 9))
-for cur_entry in all_times:
-    params, cur_time_arr = cur_entry
-    m, n, k = params
+for (m, n, k), cur_time_arr in all_times:
     results.append([m, n, k, cur_time_arr[0]])
-    label_str = f"m: {m}, n: {n}, k: {k}"
-    plt.plot(cur_time_arr, label=label_str)
-plt.xlabel('Turn #')
-plt.ylabel('Time (s)')
-plt.title('MiniMax Execution Times')
-plt.legend()
-plt.grid()
-plt.tight_layout()
-plt.savefig(f'{output_folder}/times.png')
+for idx, (_, cur_move_arr) in enumerate(all_move_counts):
+    results[idx].append(cur_move_arr[0])
+
+# Plot times
+plot_stats(all_times, 'Time (s)', 'MiniMax Execution Times', f'{output_folder}/times.png')
 
 # Plot visited states
-plt.figure(figsize=(12, 9))
-for idx, cur_entry in enumerate(all_move_counts):
-    params, cur_move_arr = cur_entry
-    m, n, k = params
-    results[idx].append(cur_move_arr[0])
-    label_str = f"m: {m}, n: {n}, k: {k}"
-    plt.plot(cur_move_arr, label=label_str)
-plt.xlabel('Turn #')
-plt.ylabel('# of Visited States')
-plt.title('MiniMax State Counts')
-plt.legend()
-plt.grid()
-plt.tight_layout()
-plt.savefig(f'{output_folder}/states.png')
+plot_stats(all_move_counts, '# of Visited States', 'MiniMax State Counts', f'{output_folder}/states.png')
 
 # Output CSV with data
 with open(f'{output_folder}/results.csv', mode='w') as file:
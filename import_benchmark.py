@@ -0,0 +1,87 @@
+import argparse
+import statistics
+import subprocess
+import sys
+
+# Modules imported by the CLI and by worker processes
+MODULES = ["main", "player", "simulation"]
+
+# Libraries that must only be loaded by reporting paths or optional backends
+HEAVY_MODULES = ["matplotlib", "numba"]
+
+IMPORT_SCRIPT = """
+import sys
+import time
+
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(elapsed, ",".join(heavy))
+"""
+
+
+def measure_import(module, repeats):
+    """
+    Imports a module in fresh interpreters and measures the import time
+
+    :param module: str, module to import
+    :param repeats: int, number of fresh interpreters to start
+
+    :return: float, median import time in milliseconds
+    :return: list, heavy modules loaded by any of the imports
+    """
+
+    times = []
+    heavy = set()
+    for _ in range(repeats):
+        output = subprocess.run(
+            [sys.executable, "-c", IMPORT_SCRIPT.format(module=module, heavy=HEAVY_MODULES)],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.split()
+        times.append(float(output[0]) * 1000)
+        if len(output) > 1:
+            heavy.update(output[1].split(","))
+    return statistics.median(times), sorted(heavy)
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Benchmark the import time of the core engine.")
+
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=5,
+        help="Number of fresh interpreters per module (default: 5)"
+    )
+
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        default=None,
+        help="Fail if a module takes longer than this to import (default: no limit)"
+    )
+
+    args = parser.parse_args()
+
+    failed = False
+    for module in MODULES:
+        median_ms, heavy = measure_import(module, args.repeats)
+        print(f"{module}: {median_ms:.1f} ms")
+
+        if heavy:
+            print(f"  loads {', '.join(heavy)} at import time")
+            failed = True
+        if args.max_ms is not None and median_ms > args.max_ms:
+            print(f"  exceeds the {args.max_ms:.1f} ms budget")
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,259 @@
+import math
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """
+        Fallback used when numba is not installed: the kernel runs as plain Python
+        """
+
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+NUMBA_AVAILABLE = njit.__module__.startswith("numba")
+
+
+@njit(cache=True, nogil=True)
+def _check_winner(grid, k):
+    """
+    Scans the whole grid for a line of k identical pieces
+
+    :return: piece of the winner, 0 if there is none
+    """
+
+    rows, cols = grid.shape
+    for row in range(rows):
+        for col in range(cols):
+            piece = grid[row, col]
+            if piece == 0:
+                continue
+            for delta_row, delta_col in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                count = 1
+                while count < k:
+                    r = row + count * delta_row
+                    c = col + count * delta_col
+                    if r < 0 or r >= rows or c < 0 or c >= cols or grid[r, c] != piece:
+                        break
+                    count += 1
+                if count == k:
+                    return piece
+    return 0
+
+
+@njit(cache=True, nogil=True)
+def _is_winning_move(grid, row, col, k):
+    """
+    Checks if the piece at (row, col) completes a line of k pieces
+
+    Only lines through the last move need checking since the position before it
+    was not terminal.
+    """
+
+    rows, cols = grid.shape
+    piece = grid[row, col]
+    for delta_row, delta_col in ((0, 1), (1, 0), (1, 1), (1, -1)):
+        count = 1
+        r, c = row + delta_row, col + delta_col
+        while 0 <= r < rows and 0 <= c < cols and grid[r, c] == piece:
+            count += 1
+            r += delta_row
+            c += delta_col
+        r, c = row - delta_row, col - delta_col
+        while 0 <= r < rows and 0 <= c < cols and grid[r, c] == piece:
+            count += 1
+            r -= delta_row
+            c -= delta_col
+        if count >= k:
+            return True
+    return False
+
+
+@njit(cache=True, nogil=True)
+def _evaluate_window(player_count, opponent_count, empty_count):
+    """
+    Mirrors player.evaluate_window on precomputed cell counts
+    """
+
+    score = 0.0
+
+    if player_count == 4:
+        score += math.inf
+    elif player_count == 3 and empty_count == 1:
+        score += 10.0
+    elif player_count == 2 and empty_count == 2:
+        score += 5.0
+
+    if opponent_count == 4:
+        score -= math.inf
+    elif opponent_count == 3 and empty_count == 1:
+        score -= 10.0
+    elif opponent_count == 2 and empty_count == 2:
+        score -= 5.0
+
+    return score
+
+
+@njit(cache=True, nogil=True)
+def _score_position(grid, piece, opponent_piece):
+    """
+    Mirrors player.score_position, visiting the windows in the same order
+    """
+
+    rows, cols = grid.shape
+    score = 0.0
+
+    center_count = 0
+    for row in range(rows):
+        if grid[row, cols // 2] == piece:
+            center_count += 1
+    score += center_count * 3.0
+
+    # Horizontal, vertical, positive diagonal and negative diagonal windows
+    for direction in range(4):
+        if direction == 0:
+            row_start, row_stop, col_stop, delta_row, delta_col = 0, rows, cols - 3, 0, 1
+        elif direction == 1:
+            row_start, row_stop, col_stop, delta_row, delta_col = 0, rows - 3, cols, 1, 0
+        elif direction == 2:
+            row_start, row_stop, col_stop, delta_row, delta_col = 0, rows - 3, cols - 3, 1, 1
+        else:
+            row_start, row_stop, col_stop, delta_row, delta_col = 3, rows, cols - 3, -1, 1
+
+        for row in range(row_start, row_stop):
+            for col in range(col_stop):
+                player_count = 0
+                opponent_count = 0
+                empty_count = 0
+                for i in range(4):
+                    cell = grid[row + i * delta_row, col + i * delta_col]
+                    if cell == piece:
+                        player_count += 1
+                    elif cell == opponent_piece:
+                        opponent_count += 1
+                    elif cell == 0:
+                        empty_count += 1
+                score += _evaluate_window(player_count, opponent_count, empty_count)
+
+    return score
+
+
+@njit(cache=True, nogil=True)
+def _minimax(
+        grid,
+        heights,
+        k,
+        depth,
+        alpha,
+        beta,
+        max_player,
+        piece,
+        opponent_piece,
+        use_heuristic,
+        pruning,
+        counter,
+):
+    """
+    Alpha-beta recursion on a raw grid, following MiniMax.minimax
+
+    :param heights: int array, number of pieces in each column
+    :param counter: int array of size 1, incremented for every visited node
+
+    :return: float, value of the best move
+    :return: int, column of the best move, -1 if there is none
+    """
+
+    counter[0] += 1
+    rows, cols = grid.shape
+
+    # Full board without a winner is a draw
+    is_draw = True
+    for col in range(cols):
+        if heights[col] < rows:
+            is_draw = False
+            break
+    if is_draw:
+        return 0.0, -1
+
+    if depth == 0 and use_heuristic:
+        return _score_position(grid, piece, opponent_piece), -1
+
+    mover = piece if max_player else opponent_piece
+    value = -math.inf if max_player else math.inf
+    column = -1
+
+    for action in range(cols):
+        if heights[action] == rows:
+            continue
+
+        row = rows - 1 - heights[action]
+        grid[row, action] = mover
+        heights[action] += 1
+
+        if _is_winning_move(grid, row, action, k):
+            counter[0] += 1
+            new_score = math.inf if max_player else -math.inf
+        else:
+            new_score, _ = _minimax(
+                grid, heights, k, depth - 1, alpha, beta, not max_player,
+                piece, opponent_piece, use_heuristic, pruning, counter,
+            )
+
+        heights[action] -= 1
+        grid[row, action] = 0
+
+        if max_player:
+            if new_score > value:
+                value = new_score
+                column = action
+            if pruning:
+                alpha = max(alpha, value)
+                if alpha >= beta:
+                    break
+        else:
+            if new_score < value:
+                value = new_score
+                column = action
+            if pruning:
+                beta = min(beta, value)
+                if alpha >= beta:
+                    break
+
+    return value, column
+
+
+def search(board, depth, max_player, piece, opponent_piece, use_heuristic=False, pruning=True):
+    """
+    Runs the compiled alpha-beta search on a copy of the board
+
+    :param board: Board, current board state
+    :param depth: int, depth of the search tree
+    :param max_player: bool, True if player is maximizer, False if player is minimizer
+    :param piece: int, represents the player's piece
+    :param opponent_piece: int, represents the opponent's piece
+    :param use_heuristic: bool, True if heuristic evaluation function is used
+    :param pruning: bool, True if alpha-beta pruning is used
+
+    :return: float, value of the best move
+    :return: int, column of the best move, None if the board is terminal
+    :return: int, number of visited states
+    """
+
+    grid = np.ascontiguousarray(board.board, dtype=np.int8).copy()
+    heights = np.count_nonzero(grid, axis=0).astype(np.int64)
+
+    # The root is checked in full, every other node only around the last move
+    winner = _check_winner(grid, board.k)
+    if winner:
+        value = math.inf if winner == piece else -math.inf if winner == opponent_piece else 0
+        return value, None, 1
+
+    counter = np.zeros(1, dtype=np.int64)
+    value, column = _minimax(
+        grid, heights, board.k, depth, -math.inf, math.inf, max_player,
+        piece, opponent_piece, use_heuristic, pruning, counter,
+    )
+    return value, (None if column < 0 else int(column)), int(counter[0])
@@ -1,9 +1,6 @@
-import matplotlib.pyplot as plt
 import numpy as np
 import time
 
-from player import Human, RandomComputer, MiniMax
-
 
 class Board:
 
@@ -28,6 +25,15 @@ class Board:
         row, col = coords
         return self.board[row, col]
 
+    def copy(self):
+        """
+        Returns an independent copy of the board
+        """
+
+        board = Board(self.COLS, self.ROWS, self.k)
+        board.board = self.board.copy()
+        return board
+
     def _get_next_open_row(self, col):
         """
         Returns the lowest available row in a column
@@ -36,7 +42,7 @@ class Board:
         :return: row to drop the piece
         """
 
-        return self.ROWS - 1 - np.count_nonzero(self.board, axis=0)[col]
+        return self.ROWS - 1 - np.count_nonzero(self.board[:, col])
 
     def check_draw(self):
         """
@@ -117,6 +123,21 @@ class Board:
                 valid_locations.append(col)
         return valid_locations
 
+    def valid_locations_into(self, buffer):
+        """
+        Writes the valid locations into a preallocated buffer instead of a new list
+        :param buffer: list with at least COLS entries
+
+        :return: number of valid locations written to the start of the buffer
+        """
+
+        count = 0
+        for col in range(self.COLS):
+            if self.board[0, col] == 0:
+                buffer[count] = col
+                count += 1
+        return count
+
     def is_terminal(self):
         """
         Checks if the game is in a terminal state (win or full board).
@@ -247,9 +268,16 @@ class Game:
             if not quiet:
                 self.draw_board()
 
+            game_over, winner = self.board.is_terminal()
+            if not game_over:
+                # Let the player search the opponent's replies during their turn
+                cur_player.start_pondering(self.board, next_player)
+
             # Players swap turns
             cur_player, next_player = next_player, cur_player
-            game_over, winner = self.board.is_terminal()
+
+        self.player1.stop_pondering()
+        self.player2.stop_pondering()
 
         if not quiet:
             print(f"Player {winner} wins!") if winner else print("It's a draw!")
@@ -0,0 +1,173 @@
+import sys
+import tracemalloc
+
+# Size of a pointer to an entry in the preallocated slot list
+SLOT_BYTES = 8
+
+
+def estimate_entry_bytes(key_length, value_length=4, key_fields=1):
+    """
+    Estimates the memory held by one transposition table entry
+
+    :param key_length: int, length of the key in bytes, e.g. the number of cells of the board
+    :param value_length: int, number of fields stored per entry
+    :param key_fields: int, number of fields of a tuple key whose last field holds the bytes, 1 for a plain bytes key
+
+    :return: int, bytes per entry
+    """
+
+    key = sys.getsizeof(bytes(key_length))
+    if key_fields > 1:
+        key += sys.getsizeof((0,) * key_fields)
+    value = sys.getsizeof((0,) * value_length) + value_length * sys.getsizeof(0.0)
+    return SLOT_BYTES + sys.getsizeof((None, None)) + key + value
+
+
+def move_buffer(buffers, ply, cols):
+    """
+    Returns the preallocated move buffer of a ply, allocating it the first time the ply is reached
+
+    :param buffers: list of per-ply buffers, grown in place
+    :param ply: int, distance from the root
+    :param cols: int, number of columns of the board
+
+    :return: list with at least cols entries
+    """
+
+    if ply == len(buffers):
+        buffers.append([0] * cols)
+    buffer = buffers[ply]
+    if len(buffer) < cols:
+        buffer.extend([0] * (cols - len(buffer)))
+    return buffer
+
+
+class BoundedTable:
+    """
+    Transposition table with a fixed number of slots
+
+    Every slot is preallocated from the memory budget, keys are mapped to a slot by
+    their hash and a new entry always replaces the one in its slot.
+    """
+
+    def __init__(self, memory_budget, entry_bytes):
+        """
+        :param memory_budget: int, maximum size of the table in bytes
+        :param entry_bytes: int, estimated size of one entry, see estimate_entry_bytes
+        """
+
+        self.size = max(1, memory_budget // entry_bytes)
+        self.slots = [None] * self.size
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def __setitem__(self, key, value):
+        index = hash(key) % self.size
+        if self.slots[index] is None:
+            self.count += 1
+        self.slots[index] = (key, value)
+
+    def get(self, key, default=None):
+        """
+        Returns the entry stored for the key, or default if it was replaced or never stored
+        """
+
+        slot = self.slots[hash(key) % self.size]
+        if slot is None or slot[0] != key:
+            return default
+        return slot[1]
+
+
+class AllocationCounter:
+    """
+    Counts what a search allocates from one node to the next
+
+    Each call to node() adds the growth of the allocated blocks and traced bytes since
+    the previous node. This counts everything a node creates that is still alive when
+    the next node starts, such as result tuples and move lists, but not temporaries
+    freed before then, so it is a lower bound on what was allocated.
+    """
+
+    def __init__(self):
+        self.blocks = 0
+        self.bytes = 0
+        self.start()
+
+    def start(self):
+        """
+        Resets the reference point, called once tracing has started
+        """
+
+        self._last_blocks = sys.getallocatedblocks()
+        self._last_bytes = tracemalloc.get_traced_memory()[0]
+
+    def node(self):
+        """
+        Called on entry to every node of the search
+        """
+
+        blocks = sys.getallocatedblocks()
+        traced_bytes = tracemalloc.get_traced_memory()[0]
+        if blocks > self._last_blocks:
+            self.blocks += blocks - self._last_blocks
+        if traced_bytes > self._last_bytes:
+            self.bytes += traced_bytes - self._last_bytes
+        self._last_blocks = blocks
+        self._last_bytes = traced_bytes
+
+
+def track_memory(func, *args, allocations=None, **kwargs):
+    """
+    Runs a function while tracing its memory allocations with tracemalloc
+
+    :param allocations: AllocationCounter, called by the function at every node, adds the
+        allocated_blocks and allocated_bytes totals to the report
+
+    :return: result of the function
+    :return: dict with the peak traced memory, the memory and blocks still held afterwards
+        and, with allocations, the blocks and bytes allocated during the search
+    """
+
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+
+    before = tracemalloc.take_snapshot()
+    start_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    if allocations is not None:
+        allocations.start()
+    try:
+        result = func(*args, **kwargs)
+        end_bytes, peak_bytes = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+
+    report = {
+        "peak_bytes": peak_bytes - start_bytes,
+        "retained_bytes": end_bytes - start_bytes,
+        "retained_blocks": (
+            sum(stat.count for stat in after.statistics("filename"))
+            - sum(stat.count for stat in before.statistics("filename"))
+        ),
+    }
+    if allocations is not None:
+        report["allocated_blocks"] = allocations.blocks
+        report["allocated_bytes"] = allocations.bytes
+    return result, report
+
+
+def per_node(report, nodes):
+    """
+    Adds the node count and the allocations per node to a track_memory report
+    """
+
+    report["nodes"] = nodes
+    if "allocated_blocks" in report:
+        report["allocated_blocks_per_node"] = report["allocated_blocks"] / max(1, nodes)
+        report["allocated_bytes_per_node"] = report["allocated_bytes"] / max(1, nodes)
+    return report
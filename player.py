@@ -1,6 +1,14 @@
 import math
 import numpy as np
 import random
+import threading
+
+from memory import AllocationCounter, move_buffer, per_node, track_memory
+
+BACKENDS = ("python", "numba")
+
+# Returned by MiniMax._take_pondered_move when the board was not pondered
+_NOT_PONDERED = object()
 
 
 class Player:
@@ -10,6 +18,29 @@ class Player:
 
     def __init__(self, piece):
         self.piece = piece
+        # Set while the player is blocked on input()
+        self.awaiting_input = threading.Event()
+
+    def read_input(self, prompt):
+        """
+        Reads a line from the user, flagging awaiting_input while blocked
+        """
+
+        self.awaiting_input.set()
+        try:
+            return input(prompt)
+        finally:
+            self.awaiting_input.clear()
+
+    def start_pondering(self, board, opponent):
+        """
+        Called after the player has moved, players that do not ponder ignore it
+        """
+
+    def stop_pondering(self):
+        """
+        Called when the game is over
+        """
 
 
 class Human(Player):
@@ -22,10 +53,10 @@ class Human(Player):
         Selects a move
         """
 
-        col = int(input(f"Player {self.piece} - choose a column to play: ")) - 1
+        col = int(self.read_input(f"Player {self.piece} - choose a column to play: ")) - 1
         while not board.is_valid(col):
             print("Invalid input, try again")
-            col = int(input("Choose a column to play: ")) - 1
+            col = int(self.read_input("Choose a column to play: ")) - 1
         return col
 
 
@@ -53,6 +84,9 @@ class MiniMax(Player):
             depth=4,
             use_heuristic=False,
             autopilot=True,
+            backend="python",
+            ponder=False,
+            track_memory=False,
     ):
         """
         Initializes the MiniMax player
@@ -64,8 +98,14 @@ class MiniMax(Player):
         :param depth: int, depth of the search tree
         :param use_heuristic: bool, True if heuristic evaluation function is used
         :param autopilot: bool, True if AI selects moves automatically
+        :param backend: str, "python" for MiniMax.minimax or "numba" for the compiled kernel
+        :param ponder: bool, True if the opponent's replies are searched during their turn
+        :param track_memory: bool, True if every search is traced with tracemalloc, see memory_report
         """
 
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}, expected one of {BACKENDS}")
+
         super().__init__(piece)
         self.opponent_piece = opponent_piece
         self.max_player = max_player
@@ -79,24 +119,164 @@ class MiniMax(Player):
         self.use_heuristic = use_heuristic
         self.counter = 0
         self.autopilot = autopilot
+        self.backend = backend
+
+        self.track_memory = track_memory
+        self.memory_report = None
+        self._allocations = None
+        self._move_buffers = []
+
+        self.ponder = ponder
+        self._ponder_thread = None
+        self._ponder_cache = {}
+        self._ponder_key = None
+        self._ponder_lock = threading.Lock()
+        self._ponder_stop = threading.Event()
+        self._ponder_abort = threading.Event()
 
     def select_move(self, board):
         """
         Selects a move
         """
 
-        self.counter = 0
-        _, action = self.minimax(
-            board, self.depth, self.alpha, self.beta, self.max_player, self.use_heuristic,
-        )
+        action = self.search(board)
 
         if self.autopilot:
             return action
         else:
             print(f"MiniMax recommended action: {action+1}")
-            col = int(input(f"Player {self.piece} - choose a column to play: ")) - 1
+            col = int(self.read_input(f"Player {self.piece} - choose a column to play: ")) - 1
             return col
 
+    def search(self, board):
+        """
+        Searches for the best move without prompting
+
+        :param board: Board, current board state
+
+        :return: int, column of the best move
+        """
+
+        if not self.track_memory:
+            return self._search(board)
+
+        # The compiled kernel cannot report its nodes, so allocations are only counted in Python
+        self._allocations = AllocationCounter() if self.backend == "python" else None
+        try:
+            action, report = track_memory(self._search, board, allocations=self._allocations)
+        finally:
+            self._allocations = None
+        self.memory_report = per_node(report, self.counter)
+        return action
+
+    def _search(self, board):
+        """
+        Reuses the pondered move if there is one, otherwise runs the configured backend
+        """
+
+        action = self._take_pondered_move(board)
+        if action is not _NOT_PONDERED:
+            return action
+
+        self.counter = 0
+        if self.backend == "numba":
+            # Imported lazily so that numba is only loaded when the kernel is used
+            import kernel
+
+            _, action, self.counter = kernel.search(
+                board, self.depth, self.max_player, self.piece, self.opponent_piece,
+                self.use_heuristic, pruning=self.alpha is not None,
+            )
+        else:
+            _, action = self.minimax(
+                board, self.depth, self.alpha, self.beta, self.max_player, self.use_heuristic,
+            )
+        return action
+
+    def start_pondering(self, board, opponent):
+        """
+        Searches every reply of the opponent in a background thread
+
+        The search waits until the opponent is blocked on input(), so it never competes
+        for the GIL with an opponent that is still searching itself.
+
+        :param board: Board, board state after this player's move
+        :param opponent: Player, the player to move next
+        """
+
+        if not self.ponder:
+            return
+
+        self.stop_pondering()
+        self._ponder_cache = {}
+        self._ponder_key = None
+        self._ponder_stop.clear()
+        self._ponder_abort.clear()
+        self._ponder_thread = threading.Thread(
+            target=self._ponder, args=(board.copy(), opponent), daemon=True,
+        )
+        self._ponder_thread.start()
+
+    def stop_pondering(self, board=None):
+        """
+        Stops the background search
+
+        :param board: Board, if the reply to this board is being searched it is allowed to finish
+        """
+
+        if self._ponder_thread is None:
+            return
+
+        with self._ponder_lock:
+            self._ponder_stop.set()
+            if board is None or self._ponder_key != board.board.tobytes():
+                self._ponder_abort.set()
+        self._ponder_thread.join()
+        self._ponder_thread = None
+
+    def _ponder(self, board, opponent):
+        """
+        Fills the ponder cache with the best move for each reply of the opponent
+        """
+
+        while not opponent.awaiting_input.wait(0.01):
+            if self._ponder_stop.is_set():
+                return
+
+        ponderer = _Ponderer(self, self._ponder_abort)
+        for reply in board.get_valid_locations():
+            row, col = board.add_piece(reply, self.opponent_piece)
+            key = board.board.tobytes()
+
+            with self._ponder_lock:
+                if self._ponder_stop.is_set():
+                    return
+                self._ponder_key = key
+
+            try:
+                action = ponderer.search(board)
+            except _PonderAborted:
+                return
+            self._ponder_cache[key] = (action, ponderer.counter)
+            board.remove_piece(row, col)
+
+    def _take_pondered_move(self, board):
+        """
+        Returns the pondered move for the board, or _NOT_PONDERED if it was not searched
+        """
+
+        if not self._ponder_cache and self._ponder_thread is None:
+            return _NOT_PONDERED
+
+        self.stop_pondering(board)
+        entry = self._ponder_cache.pop(board.board.tobytes(), None)
+        self._ponder_cache = {}
+        if entry is None:
+            return _NOT_PONDERED
+
+        action, self.counter = entry
+        return action
+
     def minimax(
             self,
             board,
@@ -105,6 +285,7 @@ class MiniMax(Player):
             beta,
             max_player,
             use_heuristic=False,
+            ply=0,
     ):
         """
         Minimax algorithm with alpha-beta pruning
@@ -115,12 +296,15 @@ class MiniMax(Player):
         :param beta: int, pruning parameter
         :param max_player: bool, True if player is maximizer, False if player is minimizer
         :param use_heuristic: bool, True if heuristic evaluation function is used
+        :param ply: int, distance from the root, selects the preallocated move buffer
 
         :return: int, column of the best move
         :return: int, value of the best move
         """
 
         self.counter += 1
+        if self._allocations is not None:
+            self._allocations.node()
 
         # Check if a terminal state has been reached
         is_terminal, winner = board.is_terminal()
@@ -138,8 +322,9 @@ class MiniMax(Player):
             score = self.heuristic(board, self.piece, self.opponent_piece)
             return (score, None)
 
-        # Get all possible actions
-        locations = board.get_valid_locations()
+        # Get all possible actions into the buffer of this ply
+        locations = move_buffer(self._move_buffers, ply, board.COLS)
+        num_locations = board.valid_locations_into(locations)
 
         # Max Player
         if max_player:
@@ -149,10 +334,11 @@ class MiniMax(Player):
 
             # Iterate over all possible columns where the player can place a piece
             # and simulate by adding a piece to the board and evaluating the state
-            for action in locations:
+            for i in range(num_locations):
+                action = locations[i]
                 row, col = board.add_piece(action, self.piece)
                 new_score, _ = self.minimax(
-                    board, depth - 1, alpha, beta, False, use_heuristic,
+                    board, depth - 1, alpha, beta, False, use_heuristic, ply + 1,
                 )
 
                 # Update the value and column if a max move is found
@@ -164,7 +350,7 @@ class MiniMax(Player):
                 board.remove_piece(row, col)
 
                 # Alpha-beta pruning
-                if alpha:
+                if alpha is not None:
                     alpha = max(alpha, value)
                     if alpha >= beta:
                         break
@@ -177,10 +363,11 @@ class MiniMax(Player):
 
             # Iterate over all possible columns where the opponent can place a piece
             # and simulate by adding a piece to the board and evaluating the state
-            for action in locations:
+            for i in range(num_locations):
+                action = locations[i]
                 row, col = board.add_piece(action, self.opponent_piece)
                 new_score, _ = self.minimax(
-                    board, depth - 1, alpha, beta, True, use_heuristic,
+                    board, depth - 1, alpha, beta, True, use_heuristic, ply + 1,
                 )
 
                 # Update the value and column if a min move is found
@@ -192,7 +379,7 @@ class MiniMax(Player):
                 board.remove_piece(row, col)
 
                 # Alpha-beta pruning
-                if beta:
+                if beta is not None:
                     beta = min(beta, value)
                     if alpha >= beta:
                         break
@@ -207,6 +394,41 @@ class MiniMax(Player):
         return score_position(board, piece, opponent_piece)
 
 
+class _PonderAborted(Exception):
+    """
+    Raised inside a pondering search once its result is no longer needed
+    """
+
+
+class _Ponderer(MiniMax):
+    """
+    MiniMax copy used by the pondering thread so that the player's own counter is untouched
+    """
+
+    def __init__(self, player, abort):
+        super().__init__(
+            player.piece,
+            player.opponent_piece,
+            player.max_player,
+            alpha_beta_pruning=player.alpha is not None,
+            depth=player.depth,
+            use_heuristic=player.use_heuristic,
+            backend=player.backend,
+        )
+        self.abort = abort
+
+    def _search(self, board):
+        # The compiled kernel cannot be interrupted, so it is only checked before it starts
+        if self.abort.is_set():
+            raise _PonderAborted
+        return super()._search(board)
+
+    def minimax(self, *args, **kwargs):
+        if self.abort.is_set():
+            raise _PonderAborted
+        return super().minimax(*args, **kwargs)
+
+
 def score_position(board, piece, opponent_piece):
     """
     Computes the heuristic score for the given board state.
@@ -251,9 +473,12 @@ def evaluate_window(window, piece, opponent_piece):
     Evaluates a 4-cell window to assign a score based on its composition.
     """
     score = 0
-    player_count = np.sum(window == piece)
-    opponent_count = np.sum(window == opponent_piece)
-    empty_count = np.sum(window == 0)
+
+    # Count on a plain list, comparing NumPy arrays allocates a temporary per count
+    cells = window.tolist() if isinstance(window, np.ndarray) else list(window)
+    player_count = cells.count(piece)
+    opponent_count = cells.count(opponent_piece)
+    empty_count = cells.count(0)
 
     # Favorable configurations for the player
     if player_count == 4:
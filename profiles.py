@@ -0,0 +1,279 @@
+import argparse
+import json
+import os
+import random
+import time
+
+from main import Board
+from player import MiniMax
+
+# Calibrated profiles are read from this file when it exists
+PROFILES_FILE = "profiles.json"
+
+# Rules picked by the number of cells on the board, the first matching rule is used
+DEFAULT_PROFILES = [
+    {"max_cells": 16, "use_heuristic": False},
+    {"max_cells": 30, "depth": 5, "use_heuristic": True, "memory_budget": 16 * 2**20},
+    {"max_cells": 42, "depth": 4, "use_heuristic": True, "memory_budget": 32 * 2**20},
+    {"max_cells": None, "depth": 3, "use_heuristic": True, "memory_budget": 64 * 2**20},
+]
+
+MINIMAX_KEYS = ("depth", "use_heuristic", "backend")
+ANALYZE_KEYS = ("depth", "time_limit", "use_heuristic", "memory_budget")
+
+
+def load_profiles(path=PROFILES_FILE):
+    """
+    Loads calibrated profiles
+
+    :param path: str, JSON file written by save_profiles
+
+    :return: list of profiles, empty if the file does not exist
+    """
+
+    if not os.path.exists(path):
+        return []
+    with open(path) as file:
+        return json.load(file)
+
+
+def save_profiles(profiles, path=PROFILES_FILE):
+    """
+    Saves calibrated profiles, replacing earlier profiles for the same boards
+
+    :param profiles: list of profiles returned by calibrate
+    :param path: str, JSON file to write
+    """
+
+    boards = [profile["board"] for profile in profiles]
+    kept = [profile for profile in load_profiles(path) if profile["board"] not in boards]
+    with open(path, mode='w') as file:
+        json.dump(kept + profiles, file, indent=2)
+
+
+def select_profile(m, n, k, profiles=None):
+    """
+    Picks the search settings for a board
+
+    A calibrated profile for the exact (m, n, k) board is preferred, otherwise the first
+    rule whose max_cells fits the board is used.
+
+    :param m: int, number of columns
+    :param n: int, number of rows
+    :param k: int, number of pieces in a row to win
+    :param profiles: list of profiles, calibrated profiles and DEFAULT_PROFILES if None
+
+    :return: dict, the selected profile
+    """
+
+    if profiles is None:
+        profiles = load_profiles() + DEFAULT_PROFILES
+
+    for profile in profiles:
+        if profile.get("board") == [m, n, k]:
+            return profile
+
+    cells = m * n
+    for profile in profiles:
+        if "board" in profile:
+            continue
+        if profile["max_cells"] is None or cells <= profile["max_cells"]:
+            return profile
+
+    raise ValueError(f"No profile matches a {m}x{n} board")
+
+
+def minimax_kwargs(profile):
+    """
+    Returns the profile settings accepted by MiniMax
+    """
+
+    return {key: profile[key] for key in MINIMAX_KEYS if key in profile}
+
+
+def analyze_kwargs(profile):
+    """
+    Returns the profile settings accepted by analysis.analyze
+
+    time_limit is only passed for profiles without a depth, which analyze would otherwise ignore.
+    """
+
+    kwargs = {key: profile[key] for key in ANALYZE_KEYS if key in profile}
+    if "depth" in kwargs:
+        kwargs.pop("time_limit", None)
+    return kwargs
+
+
+class _Timeout(Exception):
+    """
+    Raised once a timed calibration search passes its deadline
+    """
+
+
+class _TimedMiniMax(MiniMax):
+    """
+    MiniMax that gives up once a deadline has passed, used to time exact solves
+    """
+
+    def __init__(self, *args, deadline, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.deadline = deadline
+
+    def minimax(self, *args, **kwargs):
+        if self.counter % 256 == 0 and time.time() > self.deadline:
+            raise _Timeout
+        return super().minimax(*args, **kwargs)
+
+
+def _solve_fits(boards, latency):
+    """
+    Checks if an exact solve of every board fits the latency target
+
+    The Python backend is used since it can be stopped at the deadline, a compiled
+    solve is only faster.
+    """
+
+    for board in boards:
+        player = _TimedMiniMax(1, 2, max_player=True, deadline=time.time() + latency)
+        try:
+            # A copy, since a search stopped at the deadline leaves its moves on the board
+            player.select_move(board.copy())
+        except _Timeout:
+            return False
+    return True
+
+
+def calibrate(m, n, k, latency=1.0, backend="python", samples=3, seed=0):
+    """
+    Finds the deepest search that stays within a latency target on this machine
+
+    An exact solve without heuristic is kept if it fits the target. Otherwise each
+    heuristic depth is timed on the empty board and a few random openings. The
+    nodes/sec and effective branching factor measured at one depth predict the time
+    of the next, which is only searched if it is expected to fit. The table size is
+    taken from the built-in rule for the board.
+
+    :param m: int, number of columns
+    :param n: int, number of rows
+    :param k: int, number of pieces in a row to win
+    :param latency: float, target time per move in seconds
+    :param backend: str, MiniMax backend to calibrate
+    :param samples: int, number of positions timed at each depth
+    :param seed: int, seed for the random openings
+
+    :return: dict, profile for the (m, n, k) board
+    :raises ValueError: if a depth 1 search already exceeds the latency target
+    """
+
+    rng = random.Random(seed)
+    boards = [Board(m, n, k)]
+    while len(boards) < samples:
+        board = Board(m, n, k)
+        piece = 1
+        for _ in range(rng.randint(1, m)):
+            board.add_piece(rng.choice(board.get_valid_locations()), piece)
+            piece = 3 - piece
+        if not board.is_terminal()[0]:
+            boards.append(board)
+
+    cells = m * n
+    profile = {
+        "board": [m, n, k],
+        "use_heuristic": False,
+        "backend": backend,
+        "latency": latency,
+    }
+    memory_budget = select_profile(m, n, k, DEFAULT_PROFILES).get("memory_budget")
+    if memory_budget is not None:
+        profile["memory_budget"] = memory_budget
+
+    if _solve_fits(boards, latency):
+        return profile
+
+    profile.update({
+        "depth": None,
+        "use_heuristic": True,
+        "nodes_per_sec": None,
+        "branching_factor": None,
+    })
+
+    # Untimed warm-up so that one-off costs such as numba's JIT compile are not measured
+    warm_up = MiniMax(1, 2, max_player=True, depth=1, use_heuristic=True, backend=backend)
+    for board in boards:
+        warm_up.select_move(board)
+
+    prev_nodes = len(boards)
+    for depth in range(1, cells + 1):
+        player = MiniMax(1, 2, max_player=True, depth=depth, use_heuristic=True, backend=backend)
+        worst_time = 0
+        nodes = 0
+        total_time = 0
+        for board in boards:
+            start_time = time.time()
+            player.select_move(board)
+            timer = time.time() - start_time
+            worst_time = max(worst_time, timer)
+            total_time += timer
+            nodes += player.counter
+
+        if worst_time > latency:
+            break
+
+        if nodes == prev_nodes and depth > 1:
+            # No node was cut off at the depth limit, so this search already solves the game
+            for key in ("depth", "nodes_per_sec", "branching_factor"):
+                profile.pop(key)
+            profile["use_heuristic"] = False
+            return profile
+
+        branching_factor = nodes / prev_nodes
+        profile["depth"] = depth
+        profile["nodes_per_sec"] = nodes / max(total_time, 1e-9)
+        profile["branching_factor"] = branching_factor
+        prev_nodes = nodes
+
+        if worst_time * branching_factor > latency:
+            break
+
+    if profile["depth"] is None:
+        raise ValueError(f"A depth 1 search on a {m}x{n} board exceeds the {latency}s latency target")
+
+    return profile
+
+
+def main():
+
+    parser = argparse.ArgumentParser(description="Calibrate the search profile of a board on this machine.")
+
+    parser.add_argument("m", type=int, help="Number of columns")
+    parser.add_argument("n", type=int, help="Number of rows")
+    parser.add_argument("k", type=int, help="Number of pieces in a row to win")
+
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=1.0,
+        help="Target time per move in seconds (default: 1.0)"
+    )
+
+    parser.add_argument(
+        "--backend",
+        default="python",
+        help="MiniMax backend to calibrate (default: python)"
+    )
+
+    parser.add_argument(
+        "--output",
+        default=PROFILES_FILE,
+        help=f"File the profile is saved to (default: {PROFILES_FILE})"
+    )
+
+    args = parser.parse_args()
+
+    profile = calibrate(args.m, args.n, args.k, args.latency, args.backend)
+    save_profiles([profile], args.output)
+    print(json.dumps(profile, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ import argparse
 
 from main import Game
 from player import Human, RandomComputer, MiniMax
+from profiles import minimax_kwargs, select_profile
 
 PLAYER1_PIECE = 1
 PLAYER2_PIECE = 2
@@ -47,11 +48,12 @@ def RandomVsRandomConnect4(num_games=1):
 
 
 def MiniMaxVsRandomConnect4(num_games=1):
+    profile = select_profile(7, 6, 4)
     player1 = MiniMax(
         PLAYER1_PIECE,
         PLAYER2_PIECE,
         max_player=True,
-        use_heuristic=True,
+        **minimax_kwargs(profile),
     )
     player2 = RandomComputer(PLAYER2_PIECE)
 
@@ -60,12 +62,14 @@ def MiniMaxVsRandomConnect4(num_games=1):
 
 
 def MiniMaxVsHumanConnect4(num_games=1):
+    profile = select_profile(7, 6, 4)
     player1 = Human(PLAYER1_PIECE)
     player2 = MiniMax(
         PLAYER2_PIECE,
         PLAYER1_PIECE,
         max_player=False,
-        use_heuristic=True,
+        **minimax_kwargs(profile),
+        ponder=True,
     )
 
     game = Game(player1, player2, 7, 6, 4)
@@ -73,20 +77,19 @@ def MiniMaxVsHumanConnect4(num_games=1):
 
 
 def MiniMaxVsMiniMax(num_games=1):
+    profile = select_profile(7, 6, 4)
     player1 = MiniMax(
         piece=PLAYER1_PIECE,
         opponent_piece=PLAYER2_PIECE,
         max_player=True,
-        depth=4,
-        use_heuristic=True,
+        **minimax_kwargs(profile),
     )
 
     player2 = MiniMax(
         piece=PLAYER2_PIECE,
         opponent_piece=PLAYER1_PIECE,
         max_player=False,
-        depth=4,
-        use_heuristic=True,
+        **minimax_kwargs(profile),
     )
 
     game = Game(player1, player2, 7, 6, 4)
@@ -94,21 +97,21 @@ def MiniMaxVsMiniMax(num_games=1):
 
 
 def HumanMiniMaxVsMiniMax(num_games=1):
+    profile = select_profile(7, 6, 4)
     player1 = MiniMax(
         piece=PLAYER1_PIECE,
         opponent_piece=PLAYER2_PIECE,
         max_player=True,
-        depth=4,
         autopilot=False,
-        use_heuristic=True,
+        **minimax_kwargs(profile),
     )
 
     player2 = MiniMax(
         piece=PLAYER2_PIECE,
         opponent_piece=PLAYER1_PIECE,
         max_player=False,
-        depth=4,
-        use_heuristic=True,
+        **minimax_kwargs(profile),
+        ponder=True,
     )
 
     game = Game(player1, player2, 7, 6, 4)
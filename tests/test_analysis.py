@@ -0,0 +1,22 @@
+from analysis import analyze, board_from_position
+
+
+def test_batch_with_mixed_shapes_matches_single_positions():
+    for moves in ["", "6712", "4453"]:
+        grid = board_from_position(moves).board
+        positions = [grid, grid.reshape(grid.shape[1], grid.shape[0])]
+
+        batch = analyze(positions, depth=4)
+        for position, result in zip(positions, batch):
+            single = analyze([position], depth=4)[0]
+            assert (result["move"], result["score"], result["pv"]) == (single["move"], single["score"], single["pv"])
+
+
+def test_shared_table_keeps_board_sizes_apart():
+    table = {}
+    grid = board_from_position("6712").board
+    analyze([grid], depth=4, table=table)
+
+    result = analyze([grid.reshape(7, 6)], depth=4, table=table)[0]
+    single = analyze([grid.reshape(7, 6)], depth=4)[0]
+    assert (result["move"], result["score"]) == (single["move"], single["score"])
@@ -0,0 +1,51 @@
+import random
+
+import pytest
+
+from main import Board
+from player import MiniMax
+
+
+def random_board(rng, m, n, k, max_moves):
+    """
+    Plays up to max_moves random moves, skipping any move that ends the game
+    """
+
+    board = Board(m, n, k)
+    piece = 1
+    for _ in range(rng.randint(0, max_moves)):
+        row, col = board.add_piece(rng.choice(board.get_valid_locations()), piece)
+        if board.is_terminal()[0]:
+            board.remove_piece(row, col)
+            break
+        piece = 3 - piece
+    return board
+
+
+@pytest.mark.parametrize("max_player", [True, False])
+@pytest.mark.parametrize("alpha_beta_pruning", [True, False])
+def test_numba_backend_matches_python(max_player, alpha_beta_pruning):
+    rng = random.Random(0)
+    for _ in range(10):
+        board = random_board(rng, 7, 6, 4, 10)
+        python_player = MiniMax(
+            1, 2, max_player, alpha_beta_pruning=alpha_beta_pruning, depth=3, use_heuristic=True,
+        )
+        numba_player = MiniMax(
+            1, 2, max_player, alpha_beta_pruning=alpha_beta_pruning, depth=3, use_heuristic=True,
+            backend="numba",
+        )
+
+        assert python_player.select_move(board) == numba_player.select_move(board)
+        assert python_player.counter == numba_player.counter
+
+
+def test_numba_backend_matches_python_without_heuristic():
+    board = Board(3, 3, 3)
+    board.add_piece(1, 1)
+
+    python_player = MiniMax(2, 1, False)
+    numba_player = MiniMax(2, 1, False, backend="numba")
+
+    assert python_player.select_move(board) == numba_player.select_move(board)
+    assert python_player.counter == numba_player.counter
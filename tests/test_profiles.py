@@ -0,0 +1,24 @@
+from profiles import DEFAULT_PROFILES, analyze_kwargs, calibrate, minimax_kwargs, select_profile
+
+
+def test_calibrate_keeps_exact_solve_when_it_fits():
+    profile = calibrate(3, 3, 3, latency=5.0)
+
+    assert profile["use_heuristic"] is False
+    assert "depth" not in profile
+
+
+def test_calibrated_profile_is_preferred_for_its_board():
+    calibrated = {"board": [7, 6, 4], "depth": 6, "use_heuristic": True}
+    profiles = [calibrated] + DEFAULT_PROFILES
+
+    assert select_profile(7, 6, 4, profiles) is calibrated
+    assert select_profile(6, 5, 4, profiles)["depth"] == 5
+
+
+def test_profile_settings_reach_minimax_and_analyze():
+    profile = {"depth": 4, "time_limit": 1.0, "use_heuristic": True, "memory_budget": 2**20}
+
+    assert minimax_kwargs(profile) == {"depth": 4, "use_heuristic": True}
+    assert analyze_kwargs(profile) == {"depth": 4, "use_heuristic": True, "memory_budget": 2**20}
+    assert analyze_kwargs({"time_limit": 1.0, "use_heuristic": True}) == {"time_limit": 1.0, "use_heuristic": True}